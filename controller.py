@@ -1,45 +1,96 @@
+import asyncio
+import copy
+import functools
 import json
-import time
+import logging
+import operator
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple
 import socket
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only used to validate array batches
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+class VibrationPreset(NamedTuple):
+    """Validated vibration commands and their encoded packet, ready to be sent repeatedly."""
+    commands: Tuple[str, ...]
+    packet: bytes
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config_cached(config_path: str) -> Dict[str, Any]:
+    """Parse a config file once per absolute path. Callers must not mutate the result."""
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
 class Asycube:
-    def __init__(self, ip: str = None, port: int = None, config_path: str = None) -> None:
+    __slots__ = (
+        'ip', 'port', 'timeout', 'socket_options', 'sock', 'config',
+        '_reader', '_constraints', '_actuator_ranges', '_duration_range',
+        '_sc_template',
+    )
+
+    # Offset of each actuator's first value in the flat SC parameter list
+    _ACTUATOR_OFFSETS = {"1": 0, "2": 4, "3": 8, "4": 12}
+    # Fetches an actuator's values in SC order with a single call
+    _get_actuator_params = operator.itemgetter("amplitude", "frequency", "phase", "waveform")
+
+    def __init__(self, ip: str = None, port: int = None, config_path: str = None,
+                 socket_options: Optional[List[Tuple[int, int, int]]] = None,
+                 timeout: float = None) -> None:
         """
         Initialize the Asycube380 controller.
 
         :param ip: The IP address of the Asycube. If None, loads from config.
         :param port: The port for TCP/IP communication. If None, loads from config.
         :param config_path: Path to config file. If None, uses config.json in same directory.
+        :param socket_options: Extra (level, option, value) tuples applied with setsockopt
+            before connecting, e.g. [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)].
+        :param timeout: Seconds to wait for a response. If None, loads from config.
         """
         # Load configuration
         if config_path is None:
             config_path = os.path.join(os.path.dirname(__file__), 'config.json')
         
         self.config = self._load_config(config_path)
+        self._constraints = self.config.get('parameter_constraints', {})
+        self._actuator_ranges = [
+            (param_name,) + self._constraint_range(param_name)
+            for param_name in ('amplitude', 'frequency', 'phase', 'waveform')
+        ]
+        self._duration_range = self._constraint_range('duration')
         
         # Set connection parameters (command line args override config)
         self.ip = ip if ip is not None else self.config.get('connection', {}).get('ip', '192.168.1.82')
         self.port = port if port is not None else self.config.get('connection', {}).get('port', 4001)
+        self.timeout = timeout if timeout is not None else self.config.get('connection', {}).get('timeout', 1.0)
+        self.socket_options = list(socket_options) if socket_options else []
         self.sock: Optional[socket.socket] = None
+        self._reader = None
+        # SC command template: vibration id, 4 x (amplitude;frequency;phase;waveform;), duration
+        self._sc_template = "SC{}=(" + "{};" * 16 + "{})"
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from JSON file."""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            # Copy so instances can't modify each other's (or the cached) config
+            return copy.deepcopy(_load_config_cached(os.path.abspath(config_path)))
         except FileNotFoundError:
-            print(f"Warning: Config file not found at {config_path}. Using default constraints.")
+            logger.warning("Config file not found at %s. Using default constraints.", config_path)
             return self._get_default_config()
         except json.JSONDecodeError as e:
-            print(f"Warning: Error parsing config file: {e}. Using default constraints.")
+            logger.warning("Error parsing config file: %s. Using default constraints.", e)
             return self._get_default_config()
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration if config file is not available."""
         return {
-            "connection": {"ip": "192.168.1.82", "port": 4001},
+            "connection": {"ip": "192.168.1.82", "port": 4001, "timeout": 1.0, "sndbuf": 65536, "rcvbuf": 65536},
             "parameter_constraints": {
                 "amplitude": {"min": 0, "max": 100},
                 "frequency": {"min": 1, "max": 250},
@@ -49,83 +100,66 @@ class Asycube:
             }
         }
 
-    def _validate_parameter(self, param_name: str, value: Any) -> bool:
+    def _constraint_range(self, param_name: str) -> Tuple[float, float]:
         """
-        Validate a parameter value against configuration constraints.
-        Only accepts integer values.
-        
+        Get the allowed (min, max) range for a parameter from configuration constraints.
+        Missing bounds are treated as unbounded.
+
         :param param_name: Name of the parameter
-        :param value: Value to validate (must be an integer)
-        :return: True if valid, False otherwise
+        :return: Tuple of (min, max)
         """
-        constraints = self.config.get('parameter_constraints', {})
-        if param_name not in constraints:
-            return True  # No constraints defined, assume valid
-        
-        if not isinstance(value, int):
-            return False
-        
-        constraint = constraints[param_name]
+        constraint = self._constraints.get(param_name, {})
         min_val = constraint.get('min')
         max_val = constraint.get('max')
-        
-        if min_val is not None and value < min_val:
-            return False
-        if max_val is not None and value > max_val:
-            return False
-        
-        return True
+        return (
+            float('-inf') if min_val is None else min_val,
+            float('inf') if max_val is None else max_val,
+        )
 
-    def _validate_json_parameters(self, json_data: dict) -> tuple[bool, str]:
-        """
-        Validate all parameters in JSON data against configuration constraints.
-        All parameters must be integers within the specified ranges.
-        
-        :param json_data: Dictionary containing vibration parameters
-        :return: Tuple of (is_valid, error_message)
-        """
-        constraints = self.config.get('parameter_constraints', {})
-        errors = []
-        
-        for vibration_id in json_data:
-            for actuator_id, params in json_data[vibration_id].items():
-                if actuator_id == "duration":
-                    # Validate duration
-                    if not isinstance(params, int):
-                        errors.append(f"Duration {params} must be an integer")
-                    elif not self._validate_parameter("duration", params):
-                        duration_constraint = constraints.get("duration", {})
-                        min_val = duration_constraint.get('min', 'N/A')
-                        max_val = duration_constraint.get('max', 'N/A')
-                        errors.append(f"Duration {params} is outside allowed range [{min_val}-{max_val}]")
-                else:
-                    # Validate actuator parameters
-                    for param_name in ['amplitude', 'frequency', 'phase', 'waveform']:
-                        if param_name in params:
-                            value = params[param_name]
-                            if not isinstance(value, int):
-                                errors.append(f"Actuator {actuator_id} {param_name} {value} must be an integer")
-                            elif not self._validate_parameter(param_name, value):
-                                param_constraint = constraints.get(param_name, {})
-                                min_val = param_constraint.get('min', 'N/A')
-                                max_val = param_constraint.get('max', 'N/A')
-                                errors.append(f"Actuator {actuator_id} {param_name} {value} is outside allowed range [{min_val}-{max_val}]")
-        
-        if errors:
-            return False, "; ".join(errors)
-        return True, ""
+    def _create_socket(self) -> socket.socket:
+        """Create the TCP socket with all socket options applied."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Commands are tiny packets; disable Nagle so each one is sent immediately
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Fixed buffers so bursts of commands don't wait on kernel autotuning
+        connection = self.config.get('connection', {})
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, connection.get('sndbuf', 65536))
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, connection.get('rcvbuf', 65536))
+        # Surface a silently dropped controller connection instead of hanging
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for level, option, value in self.socket_options:
+            sock.setsockopt(level, option, value)
+        return sock
 
     def connect(self) -> None:
         """Establish a TCP connection to the Asycube."""
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.connect((self.ip, self.port))
-        print(f"Connected to Asycube at {self.ip}:{self.port}")
+        sock = self._create_socket()
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect((self.ip, self.port))
+            # Responses are framed by \r\n, read them one line at a time
+            reader = sock.makefile('rb')
+        except BaseException:
+            sock.close()
+            raise
+        self.sock = sock
+        self._reader = reader
+        logger.info("Connected to Asycube at %s:%s", self.ip, self.port)
 
     def disconnect(self) -> None:
         """Close the TCP connection."""
+        if self._reader:
+            self._reader.close()
+            self._reader = None
         if self.sock:
             self.sock.close()
-            print("Disconnected from Asycube")
+            self.sock = None
+            logger.info("Disconnected from Asycube")
+
+    def _check_connected(self) -> None:
+        """Raise ConnectionError if there is no open connection."""
+        if self.sock is None:
+            raise ConnectionError("Not connected to Asycube")
 
     def send_command(self, command: str) -> Optional[str]:
         """
@@ -135,25 +169,140 @@ class Asycube:
         :return: The response from the Asycube, or None if an error occurs.
         """
         try:
-            # Construct the command packet
-            packet = f"{{{command}}}\r\n"
-            #print(f"Sending: {packet}")
-            self.sock.sendall(packet.encode("utf-8"))
-            time.sleep(0.1)  # Wait for the command to be processed
-            response = self.sock.recv(1024).decode("utf-8")
+            self._check_connected()
+            self.sock.sendall(self._encode_commands([command]))
+            response = self._reader.readline().decode("utf-8")
             return response
+        except socket.timeout:
+            # The reader is unusable after a timeout and a late reply would be
+            # matched to the wrong command, so the caller has to reconnect
+            logger.error("Timed out waiting for response to %s, closing connection", command)
+            self.disconnect()
+            return None
         except Exception as e:
-            print(f"Error sending command: {e}")
+            logger.error("Error sending command: %s", e)
             return None
 
+    def send_commands(self, commands: List[str]) -> Optional[List[str]]:
+        """
+        Send several commands to the Asycube in a single write and return their responses.
+
+        :param commands: The commands to send to the Asycube, in order.
+        :return: One response per command, or None if an error occurs.
+        """
+        return self._send_packet(self._encode_commands(commands), len(commands))
+
+    @staticmethod
+    def _encode_commands(commands: Sequence[str]) -> bytes:
+        """Frame and encode commands into a single packet."""
+        if not commands:
+            return b""
+        # One join and one encode for the whole packet instead of per command
+        return "".join(("{", "}\r\n{".join(commands), "}\r\n")).encode("utf-8")
+
+    def _send_packet(self, packet: bytes, count: int) -> Optional[List[str]]:
+        """
+        Send an encoded packet and read one response per command it contains.
+
+        :param packet: The framed and encoded commands.
+        :param count: The number of commands in the packet.
+        :return: One response per command, or None if an error occurs.
+        """
+        try:
+            self._check_connected()
+            self.sock.sendall(packet)
+            return [self._reader.readline().decode("utf-8") for _ in range(count)]
+        except socket.timeout:
+            # See send_command: the connection can't be reused after a timeout
+            logger.error("Timed out waiting for responses, closing connection")
+            self.disconnect()
+            return None
+        except Exception as e:
+            logger.error("Error sending commands: %s", e)
+            return None
+
+    def prepare_vibration(self, json_data: dict) -> VibrationPreset:
+        """
+        Validate JSON vibration data and encode it once for repeated use with vibrate_preset.
+        The preset is validated against this controller's constraints.
+
+        :param json_data: A dictionary in the format accepted by vibrate_from_json.
+        :return: The validated commands and encoded packet.
+        :raises ValueError: If any parameters are missing, not integers or outside allowed ranges.
+        """
+        commands = tuple(self._build_vibration_commands(json_data))
+        return VibrationPreset(commands, self._encode_commands(commands))
+
+    def _build_vibration_commands(self, json_data: dict) -> List[str]:
+        """
+        Validate JSON vibration data and build the SC/C command pair for each vibration.
+
+        :param json_data: A dictionary containing actuator IDs and their parameters.
+        :return: The commands to send, in order.
+        :raises ValueError: If any parameters are not integers or are outside allowed ranges.
+        """
+        actuator_ranges = self._actuator_ranges
+        actuator_offsets = self._ACTUATOR_OFFSETS
+        get_actuator_params = self._get_actuator_params
+        duration_min, duration_max = self._duration_range
+
+        commands = []
+        for vibration_id in json_data:
+            values = [0] * 16
+            duration = None
+            for actuator_id, params in json_data[vibration_id].items():
+                if actuator_id == "duration":
+                    duration = params
+                    # bool is an int subclass but would be sent as "True"/"False"
+                    if type(duration) is bool or not isinstance(duration, int):
+                        raise ValueError(f"Parameter validation failed: Duration {duration} must be an integer")
+                    if not duration_min <= duration <= duration_max:
+                        raise ValueError(
+                            f"Parameter validation failed: Duration {duration} is outside allowed range "
+                            f"[{duration_min}-{duration_max}]"
+                        )
+                    continue
+
+                offset = actuator_offsets.get(actuator_id)
+                if offset is None:
+                    # Also accept integer actuator ids
+                    offset = actuator_offsets.get(str(actuator_id))
+                    if offset is None:
+                        raise ValueError(f"Parameter validation failed: Unknown actuator {actuator_id}")
+                try:
+                    actuator_values = get_actuator_params(params)
+                except KeyError as e:
+                    raise ValueError(
+                        f"Parameter validation failed: Actuator {actuator_id} is missing {e.args[0]}"
+                    ) from None
+                for i, ((param_name, min_val, max_val), value) in enumerate(zip(actuator_ranges, actuator_values)):
+                    if type(value) is bool or not isinstance(value, int):
+                        raise ValueError(
+                            f"Parameter validation failed: Actuator {actuator_id} {param_name} {value} "
+                            f"must be an integer"
+                        )
+                    if not min_val <= value <= max_val:
+                        raise ValueError(
+                            f"Parameter validation failed: Actuator {actuator_id} {param_name} {value} "
+                            f"is outside allowed range [{min_val}-{max_val}]"
+                        )
+                    values[offset + i] = value
+            if duration is None:
+                raise ValueError(f"Parameter validation failed: Vibration {vibration_id} is missing duration")
+            cmd_out = self._sc_template.format(vibration_id, *values, duration)
+            commands.extend([cmd_out, f"C{vibration_id}"])
+        return commands
+
     def vibrate_from_json(self, json_data: dict) -> None:
         """
         Vibrate actuators based on JSON data.
         Validates all parameters against configuration constraints before vibrating.
         All parameter values must be integers within the allowed ranges.
+        Each listed actuator must define all four parameters and each vibration a duration;
+        actuators that are left out are sent as 0.
 
         :param json_data: A dictionary containing actuator IDs and their parameters.
-        :raises ValueError: If any parameters are not integers or are outside allowed ranges.
+        :raises ValueError: If any parameters are missing, not integers or outside allowed ranges.
 
         .. code-block:: json
 
@@ -175,31 +324,186 @@ class Asycube:
                 }
             }
         """
-        # Validate parameters before vibrating
-        is_valid, error_message = self._validate_json_parameters(json_data)
-        if not is_valid:
-            raise ValueError(f"Parameter validation failed: {error_message}")
-        
-        json_data = json.loads(json.dumps(json_data))
-        for vibration_id in json_data:
-            cmd_base = f"SC{vibration_id}="
-            cmd_actuators = ["0;0;0;0;"] * 4
-            for actuator_id, params in json_data[vibration_id].items():
-                if actuator_id != "duration":
-                    amplitude = params.get("amplitude")
-                    frequency = params.get("frequency")
-                    phase = params.get("phase")
-                    waveform = params.get("waveform") 
-                    
-                    cmd_actuators[int(actuator_id) - 1] = f"{amplitude};{frequency};{phase};{waveform};"
-            duration = json_data[vibration_id].get("duration")
-            cmd_out = (
-                cmd_base + f"({cmd_actuators[0]}{cmd_actuators[1]}{cmd_actuators[2]}{cmd_actuators[3]}{duration})"
+        self.vibrate_preset(self.prepare_vibration(json_data))
+
+    def vibrate_preset(self, preset: VibrationPreset) -> None:
+        """
+        Vibrate actuators from a preset built by prepare_vibration.
+        Skips validation and formatting, so a repeated vibration costs a single write.
+
+        :param preset: The prepared vibration.
+        """
+        responses = self._send_packet(preset.packet, len(preset.commands))
+        logger.debug("Vibration commands sent: %s, Responses: %s", preset.commands, responses)
+
+    def vibrate_sequence(self, json_list: List[dict]) -> None:
+        """
+        Vibrate actuators for several JSON vibration definitions in a single write.
+        Every entry is validated before anything is sent.
+
+        :param json_list: A list of dictionaries in the format accepted by vibrate_from_json.
+        :raises ValueError: If any parameters are not integers or are outside allowed ranges.
+        """
+        commands, packet = self._encode_sequence(json_list)
+        responses = self._send_packet(packet, len(commands))
+        logger.debug("Vibration commands sent: %s, Responses: %s", commands, responses)
+
+    def _encode_sequence(self, json_list: List[dict]) -> Tuple[List[str], bytes]:
+        """
+        Get the validated commands and single encoded packet for several JSON vibration definitions.
+
+        :param json_list: A list of dictionaries in the format accepted by vibrate_from_json.
+        :return: Tuple of (commands, encoded packet)
+        :raises ValueError: If any parameters are not integers or are outside allowed ranges.
+        """
+        commands = []
+        packets = []
+        for json_data in json_list:
+            vibration_commands, packet = self.prepare_vibration(json_data)
+            commands.extend(vibration_commands)
+            packets.append(packet)
+        return commands, b"".join(packets)
+
+    def vibrate_batch(self, params: Sequence[Sequence[Sequence[int]]], durations: Sequence[int],
+                      vibration_ids: Sequence[str]) -> Optional[List[str]]:
+        """
+        Vibrate a batch of pre-structured vibrations in a single write.
+        Avoids building a JSON dictionary per vibration for high-rate scripted sequences.
+        Every vibration is validated before anything is sent.
+
+        :param params: Actuator values per vibration, shaped (N, 4, 4) as
+            [vibration][actuator][amplitude, frequency, phase, waveform]. An integer
+            NumPy array is validated in a single vectorized pass.
+        :param durations: Duration of each vibration, length N.
+        :param vibration_ids: Vibration ID of each vibration, length N.
+        :return: One response per command, or None if an error occurs.
+        :raises ValueError: If any parameters are not integers or are outside allowed ranges.
+        """
+        return self.send_commands(self._build_batch_commands(params, durations, vibration_ids))
+
+    def _build_batch_commands(self, params: Sequence[Sequence[Sequence[int]]], durations: Sequence[int],
+                              vibration_ids: Sequence[str]) -> List[str]:
+        """
+        Validate pre-structured vibrations and build the SC/C command pair for each.
+        See vibrate_batch for the argument layout.
+
+        :return: The commands to send, in order.
+        :raises ValueError: If the inputs are not shaped (N, 4, 4), (N,) and (N,), or any parameters
+            are not integers or are outside allowed ranges.
+        """
+        if np is not None and isinstance(params, np.ndarray):
+            return self._build_array_batch_commands(params, np.asarray(durations), vibration_ids)
+
+        actuator_ranges = self._actuator_ranges
+        duration_min, duration_max = self._duration_range
+        sc_template = self._sc_template
+
+        if not len(params) == len(durations) == len(vibration_ids):
+            raise ValueError(
+                f"Parameter validation failed: params, durations and vibration_ids must have the same length, "
+                f"got {len(params)}, {len(durations)} and {len(vibration_ids)}"
             )
-        response = self.send_command(cmd_out)
-        print(f"Vibration command sent: {cmd_out}, Response: {response}")
 
-        response = self.send_command(f"C{vibration_id}")
+        commands = []
+        for vibration_id, actuators, duration in zip(vibration_ids, params, durations):
+            if len(actuators) != 4:
+                raise ValueError(
+                    f"Parameter validation failed: Vibration {vibration_id} must have 4 actuators, got {len(actuators)}"
+                )
+            values = []
+            for actuator_id, actuator in enumerate(actuators, start=1):
+                if len(actuator) != 4:
+                    raise ValueError(
+                        f"Parameter validation failed: Actuator {actuator_id} must have 4 values, got {len(actuator)}"
+                    )
+                for (param_name, min_val, max_val), value in zip(actuator_ranges, actuator):
+                    try:
+                        # Rejects bools like the JSON path, operator.index would turn them into 1/0
+                        if isinstance(value, bool):
+                            raise TypeError
+                        value = operator.index(value)
+                    except TypeError:
+                        raise ValueError(
+                            f"Parameter validation failed: Actuator {actuator_id} {param_name} {value} "
+                            f"must be an integer"
+                        ) from None
+                    if not min_val <= value <= max_val:
+                        raise ValueError(
+                            f"Parameter validation failed: Actuator {actuator_id} {param_name} {value} "
+                            f"is outside allowed range [{min_val}-{max_val}]"
+                        )
+                    values.append(value)
+            try:
+                if isinstance(duration, bool):
+                    raise TypeError
+                duration = operator.index(duration)
+            except TypeError:
+                raise ValueError(f"Parameter validation failed: Duration {duration} must be an integer") from None
+            if not duration_min <= duration <= duration_max:
+                raise ValueError(
+                    f"Parameter validation failed: Duration {duration} is outside allowed range "
+                    f"[{duration_min}-{duration_max}]"
+                )
+            commands.append(sc_template.format(vibration_id, *values, duration))
+            commands.append(f"C{vibration_id}")
+        return commands
+
+    def _build_array_batch_commands(self, params: "np.ndarray", durations: "np.ndarray",
+                                    vibration_ids: Sequence[str]) -> List[str]:
+        """
+        Build batch commands from NumPy arrays, validating every value with vectorized comparisons.
+        The integer dtype guarantees integer values, so no per-element type checks are needed.
+
+        :param params: Integer array of shape (N, 4, 4).
+        :param durations: Integer array of shape (N,).
+        :param vibration_ids: Vibration ID of each vibration, length N.
+        :return: The commands to send, in order.
+        :raises ValueError: If the arrays have the wrong shape or dtype, or values are outside allowed ranges.
+        """
+        if params.ndim != 3 or params.shape[1:] != (4, 4):
+            raise ValueError(f"Parameter validation failed: params must have shape (N, 4, 4), got {params.shape}")
+        if durations.shape != params.shape[:1]:
+            raise ValueError(
+                f"Parameter validation failed: durations must have shape {params.shape[:1]}, got {durations.shape}"
+            )
+        if len(vibration_ids) != len(params):
+            raise ValueError(
+                f"Parameter validation failed: vibration_ids must have length {len(params)}, got {len(vibration_ids)}"
+            )
+        if not np.issubdtype(params.dtype, np.integer):
+            raise ValueError(f"Parameter validation failed: params dtype {params.dtype} must be an integer type")
+        if not np.issubdtype(durations.dtype, np.integer):
+            raise ValueError(f"Parameter validation failed: durations dtype {durations.dtype} must be an integer type")
+
+        actuator_ranges = self._actuator_ranges
+        min_vals = np.array([min_val for _, min_val, _ in actuator_ranges])
+        max_vals = np.array([max_val for _, _, max_val in actuator_ranges])
+        invalid = (params < min_vals) | (params > max_vals)
+        if invalid.any():
+            vibration, actuator, param = np.argwhere(invalid)[0]
+            param_name, min_val, max_val = actuator_ranges[param]
+            raise ValueError(
+                f"Parameter validation failed: Actuator {actuator + 1} {param_name} "
+                f"{params[vibration, actuator, param]} is outside allowed range [{min_val}-{max_val}]"
+            )
+
+        duration_min, duration_max = self._duration_range
+        invalid = (durations < duration_min) | (durations > duration_max)
+        if invalid.any():
+            duration = durations[np.argmax(invalid)]
+            raise ValueError(
+                f"Parameter validation failed: Duration {duration} is outside allowed range "
+                f"[{duration_min}-{duration_max}]"
+            )
+
+        sc_template = self._sc_template
+        commands = []
+        for vibration_id, values, duration in zip(
+            vibration_ids, params.reshape(len(params), 16).tolist(), durations.tolist()
+        ):
+            commands.append(sc_template.format(vibration_id, *values, duration))
+            commands.append(f"C{vibration_id}")
+        return commands
 
     def print_parameter_constraints(self) -> None:
         """Print current parameter constraints from configuration."""
@@ -216,8 +520,150 @@ class Asycube:
         return self.config.get('parameter_constraints', {})
 
 
+class AsyncAsycube(Asycube):
+    """
+    asyncio variant of the Asycube controller.
+
+    Shares configuration, validation and command building with Asycube, but all
+    communication methods are coroutines. This lets several controllers be driven
+    concurrently from one thread, e.g. with asyncio.gather().
+    """
+    __slots__ = ('_writer',)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self) -> None:
+        """Establish a TCP connection to the Asycube."""
+        sock = self._create_socket()
+        sock.setblocking(False)
+        try:
+            await asyncio.wait_for(
+                asyncio.get_running_loop().sock_connect(sock, (self.ip, self.port)), self.timeout
+            )
+            reader, writer = await asyncio.open_connection(sock=sock)
+        except BaseException:
+            sock.close()
+            raise
+        self._reader, self._writer = reader, writer
+        self.sock = sock
+        logger.info("Connected to Asycube at %s:%s", self.ip, self.port)
+
+    async def disconnect(self) -> None:
+        """Close the TCP connection."""
+        if self._writer:
+            writer = self._writer
+            self._writer = None
+            self._reader = None
+            self.sock = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError as e:
+                # The connection is closed either way, e.g. the peer already reset it
+                logger.warning("Error while closing connection: %s", e)
+            logger.info("Disconnected from Asycube")
+
+    async def _read_response(self) -> str:
+        """Read one \\r\\n-terminated response frame."""
+        return (await asyncio.wait_for(self._reader.readuntil(b"\r\n"), self.timeout)).decode("utf-8")
+
+    async def send_command(self, command: str) -> Optional[str]:
+        """
+        Send a command to the Asycube and return the response.
+
+        :param command: The command to send to the Asycube.
+        :return: The response from the Asycube, or None if an error occurs.
+        """
+        try:
+            self._check_connected()
+            self._writer.write(self._encode_commands([command]))
+            await self._writer.drain()
+            return await self._read_response()
+        except asyncio.TimeoutError:
+            # A late reply would be matched to the wrong command, so the caller has to reconnect
+            logger.error("Timed out waiting for response to %s, closing connection", command)
+            await self.disconnect()
+            return None
+        except Exception as e:
+            logger.error("Error sending command: %s", e)
+            return None
+
+    async def send_commands(self, commands: List[str]) -> Optional[List[str]]:
+        """
+        Send several commands to the Asycube in a single write and return their responses.
+
+        :param commands: The commands to send to the Asycube, in order.
+        :return: One response per command, or None if an error occurs.
+        """
+        return await self._send_packet(self._encode_commands(commands), len(commands))
+
+    async def _send_packet(self, packet: bytes, count: int) -> Optional[List[str]]:
+        """
+        Send an encoded packet and read one response per command it contains.
+
+        :param packet: The framed and encoded commands.
+        :param count: The number of commands in the packet.
+        :return: One response per command, or None if an error occurs.
+        """
+        try:
+            self._check_connected()
+            self._writer.write(packet)
+            await self._writer.drain()
+            return [await self._read_response() for _ in range(count)]
+        except asyncio.TimeoutError:
+            logger.error("Timed out waiting for responses, closing connection")
+            await self.disconnect()
+            return None
+        except Exception as e:
+            logger.error("Error sending commands: %s", e)
+            return None
+
+    async def vibrate_from_json(self, json_data: dict) -> None:
+        """
+        Vibrate actuators based on JSON data. See Asycube.vibrate_from_json.
+
+        :param json_data: A dictionary containing actuator IDs and their parameters.
+        :raises ValueError: If any parameters are not integers or are outside allowed ranges.
+        """
+        await self.vibrate_preset(self.prepare_vibration(json_data))
+
+    async def vibrate_preset(self, preset: VibrationPreset) -> None:
+        """
+        Vibrate actuators from a preset built by prepare_vibration. See Asycube.vibrate_preset.
+
+        :param preset: The prepared vibration.
+        """
+        responses = await self._send_packet(preset.packet, len(preset.commands))
+        logger.debug("Vibration commands sent: %s, Responses: %s", preset.commands, responses)
+
+    async def vibrate_sequence(self, json_list: List[dict]) -> None:
+        """
+        Vibrate actuators for several JSON vibration definitions in a single write.
+        See Asycube.vibrate_sequence.
+
+        :param json_list: A list of dictionaries in the format accepted by vibrate_from_json.
+        :raises ValueError: If any parameters are not integers or are outside allowed ranges.
+        """
+        commands, packet = self._encode_sequence(json_list)
+        responses = await self._send_packet(packet, len(commands))
+        logger.debug("Vibration commands sent: %s, Responses: %s", commands, responses)
+
+    async def vibrate_batch(self, params: Sequence[Sequence[Sequence[int]]], durations: Sequence[int],
+                            vibration_ids: Sequence[str]) -> Optional[List[str]]:
+        """
+        Vibrate a batch of pre-structured vibrations in a single write. See Asycube.vibrate_batch.
+
+        :return: One response per command, or None if an error occurs.
+        :raises ValueError: If any parameters are not integers or are outside allowed ranges.
+        """
+        return await self.send_commands(self._build_batch_commands(params, durations, vibration_ids))
+
+
 # Example usage:
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     
     asycube = Asycube()
     print("Current parameter constraints:")